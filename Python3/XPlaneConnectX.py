@@ -2,27 +2,123 @@ import struct
 import socket
 import threading
 import datetime
+import itertools
+import queue
+import time
+import warnings
 from typing import Tuple
 
+_DREF_PACK = struct.Struct('<4sxf500s')            # write a DataRef
+_CMND_PACK = struct.Struct('<4sx500s')             # trigger a command
+_RREF_PACK = struct.Struct('<4sxii400s')           # request a DataRef at a given frequency
+_POSI_PACK = struct.Struct('<4sxidddfff')          # set the position of an aircraft
+_RPOS_PACK = struct.Struct('<4sx10s')              # request the position of the ego aircraft at a given frequency
+_RPOS_UNPACK = struct.Struct('<xdddffffffffff')    # position of the ego aircraft following the RPOS header
+_DREF_VALUE = struct.Struct('<f')                  # value field of a DREF packet
+_DREF_VALUE_OFFSET = 5                             # the value follows the 4 byte header and its null byte
+_RREF_VALUE = struct.Struct('<if')                 # (index, value) pair of a single DataRef within an RREF packet
+
+_GETDREF_FIRST_INDEX = 10000     # indices for getDREF requests start here, well above the indices of subscribed DataRefs
+
+_BLOCK_DECODE_MIN = 16     # minimum number of subscribed DataRefs for decoding RREF packets with a single unpack call
+
+_MONOTONIC_TO_EPOCH_NS = time.time_ns() - time.monotonic_ns()    # offset between the monotonic clock and the wall clock
+
+# DataRefs written by sendCTRL, in the order of its arguments
+_CTRL_DREFS = (b"sim/cockpit2/controls/yoke_roll_ratio",                     # lateral control
+               b"sim/cockpit2/controls/yoke_pitch_ratio",                    # longitudinal control
+               b"sim/cockpit2/controls/yoke_heading_ratio",                  # rudder control
+               b"sim/cockpit2/engine/actuators/throttle_jet_rev_ratio_all",  # throttle
+               b"sim/cockpit/switches/gear_handle_status",                   # gear
+               # b"sim/cockpit2/controls/flap_handle_request_ratio",         # flaps, this only for X-Plane 12.0+
+               b"sim/cockpit2/controls/flap_ratio",                          # flaps
+               b"sim/cockpit2/controls/speedbrake_ratio",                    # speedbrakes
+               b"sim/cockpit2/controls/parking_brake_ratio",                 # park brake
+               )
+
 class XPlaneConnectX():
-    def __init__(self,ip:str='127.0.0.1',port:int=49000) -> None:
+    def __init__(self,ip:str='127.0.0.1',port:int=49000,rcvbuf:int=8*1024*1024,sndbuf:int=8*1024*1024) -> None:
         """XPlaneConnectX class initialization.
 
         Args:
             ip (str, optional): IP address where X-Plane can be found. Defaults to '127.0.0.1'.
             port (int, optional): Port to communicate with X-Plane. This can be found and changed in the X-Plane network settings. Defaults to 49000.
+            rcvbuf (int, optional): Requested size of the UDP receive buffer in bytes. Larger buffers prevent the operating system from dropping packets when subscribing to many DataRefs at high frequencies. The operating system may cap this value, if it rejects the size, successively halved sizes are requested. Defaults to 8MB.
+            sndbuf (int, optional): Requested size of the UDP send buffer in bytes. The operating system may cap this value, if it rejects the size, successively halved sizes are requested. Defaults to 8MB.
         
         Example:
             xpc = XPlaneConnectX()  # Uses default IP and port
             xpc = XPlaneConnectX(ip="192.168.1.10", port=50000) # Custom IP and port
+            xpc = XPlaneConnectX(rcvbuf=16*1024*1024)   # Larger receive buffer for many high frequency subscriptions
         """
         
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.ip = ip
         self.port = port
-        self.reverse_index = {}
-        self.current_dref_values = {}
+        self.rcvbuf = rcvbuf
+        self.sndbuf = sndbuf
+        self.sock = self._create_socket()
+        self._addr = (socket.gethostbyname(self.ip), self.port)     # the address is fixed, resolve it only once
+        self.reverse_index = []
+        self._subscription_index: dict[str, int] = {}   # subscription index of each subscribed DataRef
+        self._values = []       # most recent value of each subscribed DataRef, indexed like self.reverse_index
+        self._timestamps = []   # time the most recent value of each subscribed DataRef was received
+        self._index_range = ()  # subscription indices as a tuple, used to detect packets containing all subscriptions
+        self._rref_block = None # (index, value) pairs of all subscribed DataRefs, used to decode them with a single unpack call
+        self._getdref_indices = itertools.count(_GETDREF_FIRST_INDEX)
+        self._getdref_responses: dict[int, queue.SimpleQueue] = {}   # pending getDREF requests by their index
+        self._observe_thread = None
+        self._observe_lock = threading.Lock()   # guards starting the observer thread, which getDREF may do from several threads
         
+        self._ctrl_packets = [bytearray(_DREF_PACK.pack(b'DREF', 0.0, dref)) for dref in _CTRL_DREFS]  # sendCTRL only patches the values
+        self._ctrl_lock = threading.Lock()  # the packets are shared, concurrent sendCTRL calls must not patch them while they are sent
+        self._dref_name_cache: dict[str, bytes] = {}
+    
+    @property
+    def current_dref_values(self) -> dict:
+        """Most recent values of the subscribed DataRefs. This is a dictionary with the DataRefs as keys, each entry
+        contains another dictionary with the keys *value* and *timestamp*. A new dictionary is assembled on every access, i.e.,
+        it does not update after it was obtained. To read single values in tight loops, use `getSubscribedDREF` instead.
+        """
+        return {dref:{'value':value, 'timestamp':timestamp} for dref, value, timestamp in zip(self.reverse_index, self._values, self._timestamps)}
+    
+    def getSubscribedDREF(self, dref:str) -> Tuple[float,int]:
+        """Gets the most recently received value of a subscribed DataRef without assembling XPlaneConnectX.current_dref_values.
+        Both the value and the timestamp are `None` as long as no value was received.
+
+        Args:
+            dref (str): Subscribed DataRef to be read.
+
+        Returns:
+            Tuple[float,int]: Most recent value of the DataRef and the time it was received in nanoseconds of the monotonic clock.
+        
+        Raises:
+            KeyError: If `dref` is not subscribed.
+        
+        Example:
+            xpc = XPlaneConnectX()
+            xpc.subscribeDREFs([("sim/flightmodel/position/y_agl", 10)])
+            y_agl, timestamp = xpc.getSubscribedDREF("sim/flightmodel/position/y_agl")
+        """
+        idx = self._subscription_index[dref]
+        return self._values[idx], self._timestamps[idx]
+    
+    def _create_socket(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        for option, size in ((socket.SO_RCVBUF, self.rcvbuf), (socket.SO_SNDBUF, self.sndbuf)):
+            # the buffer sizes are only hints, some operating systems (e.g., macOS) reject sizes above their limit instead of capping them
+            while size > 0:
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, option, size)
+                    break
+                except OSError:
+                    size //= 2
+        return sock
+    
+    def _encode_dref(self, dref:str) -> bytes:
+        dref_bytes = self._dref_name_cache.get(dref)
+        if dref_bytes is None:
+            dref_bytes = self._dref_name_cache[dref] = dref.encode('utf-8')
+        return dref_bytes
     
     def subscribeDREFs(self, subscribed_drefs:list[Tuple[str,int]]) -> None:
         """Permanently subscribe to a list of DataRefs with a certain frequency. This is the prefered method for obtaining 
@@ -31,7 +127,8 @@ class XPlaneConnectX():
         is different than the `getDREF` or `getPOSI` method that run synchronously. The most recently value for each subscribed
         DataRef is stored in XPlaneConnectX.current_dref_values which is a dictionary with the DataRefs as keys. Each entry of
         the dictionary contains another dictionary with the keys *value* and "timestamp* containing the most recent value of
-        DataRef as well as the time it was received, respectiveley. 
+        DataRef as well as the time it was received, respectiveley. The timestamp is given in nanoseconds of the monotonic clock
+        (see `time.monotonic_ns`) and can be converted with `XPlaneConnectX.timestamp_to_datetime`.
 
         Args:
             subscribed_drefs (list[Tuple[str,int]]): List of (DataRef, frequency) tuples to be permanently observed. Example: [("sim/cockpit2/controls/brake_fan_on", 2), ("sim/flightmodel/position/y_agl",10)].
@@ -43,9 +140,16 @@ class XPlaneConnectX():
         
         self.subscribed_drefs = subscribed_drefs
         
-        # initialize the current data dictionary that always contains the most up-to-date data received from the simulator
-        self.reverse_index = {i:sdf[0] for i,sdf in enumerate(self.subscribed_drefs)}
-        self.current_dref_values = {sdf[0]:{'value':None, 'timestamp':None} for sdf in self.subscribed_drefs}
+        # initialize the storage that always contains the most up-to-date data received from the simulator
+        self.reverse_index = [sdf[0] for sdf in self.subscribed_drefs]     # the subscription index of each DataRef is its position in this list
+        self._values = [None]*len(self.subscribed_drefs)
+        self._timestamps = [None]*len(self.subscribed_drefs)
+        self._index_range = tuple(range(len(self.subscribed_drefs)))
+        self._subscription_index = {dref:i for i, dref in enumerate(self.reverse_index)}
+        if len(self.subscribed_drefs) >= _BLOCK_DECODE_MIN:
+            self._rref_block = struct.Struct('<' + 'if'*len(self.subscribed_drefs))
+        else:
+            self._rref_block = None
         
         self._create_observation_requests()
         self._observe_async()
@@ -55,58 +159,97 @@ class XPlaneConnectX():
             dref = sdf[0]
             cmd = b'RREF'  # "Request DREF"
             freq = sdf[1]     
-            msg = struct.pack("<4sxii400s", cmd, freq, i, dref.encode('utf-8'))
-            self.sock.sendto(msg, (self.ip, self.port))
+            msg = _RREF_PACK.pack(cmd, freq, i, self._encode_dref(dref))
+            self.sock.sendto(msg, self._addr)
                     
     def _observe(self) -> None:
+        buf = bytearray(65536)      # large enough for any UDP datagram, reused for every received packet
+        view = memoryview(buf)
         while True:
-            data, addr = self.sock.recvfrom(16348)
-            header = data[0:4]
-            if header[0:4] == b'RREF':
-                if ((len(data)-5)%8) != 0:
-                    raise ValueError("Received data is not 8 bytes long")
-                no_packets = int((len(data)-5) / 8)
-                for p_idx in range(no_packets):
-                    p_data = data[(5+p_idx*8):(5+(p_idx+1)*8)]
-                    idx, value = struct.unpack("<if", p_data)
-                    if idx in self.reverse_index.keys():    # if not in self.reverse_idx, the received packet is for the getDREF method
-                        # write current values to the self.current_dref_values dictionary
-                        self.current_dref_values[self.reverse_index[idx]] = {'value':value, 'timestamp':datetime.datetime.now()}
-                    else:
-                        raise ValueError("Received a packet with invalid index.")
+            try:
+                nbytes = self.sock.recv_into(buf)
+            except ConnectionError:
+                continue    # a previous packet could not be delivered, e.g., because X-Plane is not running (yet)
+            self._process_packet(view[:nbytes], time.monotonic_ns())    # all values within one packet were received at the same time
+    
+    def _process_packet(self, data:memoryview, timestamp:int) -> None:
+        if data[0:4] == b'RREF':
+            if ((len(data)-5)%8) != 0:
+                # skip the packet instead of raising, an exception would end the observer thread
+                warnings.warn("Skipping RREF packet whose payload is not a multiple of 8 bytes long.", RuntimeWarning)
+                return
+            values = self._values
+            timestamps = self._timestamps
+            block = self._rref_block
+            if block is not None and len(data)-5 == block.size and len(values) == block.size//8:
+                # the packet may contain all subscriptions in order, decode all pairs in one call and store them with slice assignments
+                payload = block.unpack_from(data, 5)
+                indices = payload[0::2]
+                if indices == self._index_range:
+                    values[:] = payload[1::2]
+                    timestamps[:] = [timestamp]*len(values)
+                    return
+                entries = zip(indices, payload[1::2])
+            else:
+                entries = _RREF_VALUE.iter_unpack(data[5:])
+            for idx, value in entries:
+                if 0 <= idx < len(values):    # if not in self.reverse_idx, the received packet is for the getDREF method
+                    # write current values in place, self.current_dref_values is assembled from these on demand
+                    values[idx] = value
+                    timestamps[idx] = timestamp
+                else:
+                    response = self._getdref_responses.get(idx)     # the value may be for a pending getDREF request
+                    if response is not None:
+                        response.put(value)
+                    elif idx < _GETDREF_FIRST_INDEX:    # late values for completed getDREF requests are expected
+                        warnings.warn("Skipping DataRef value with invalid index.", RuntimeWarning)
     
     def _observe_async(self) -> None:
-        observe_thread = threading.Thread(target=self._observe)
-        observe_thread.daemon = True
-        observe_thread.start()
+        with self._observe_lock:
+            if self._observe_thread is not None:
+                return      # a single thread receives the values of subscriptions as well as getDREF requests
+            observe_thread = threading.Thread(target=self._observe)
+            observe_thread.daemon = True
+            observe_thread.start()
+            self._observe_thread = observe_thread
         
-    def getDREF(self, dref:str) -> float:
+    def getDREF(self, dref:str, timeout:float=5.0) -> float:
         """Gets the current value of a DataRef. This is only intended for one-time use. For datarefs with frequent use, consider using the permanently observed DataRefs that can be setup when initializing the XPlaneConnectX object.
 
         Args:
             dref (str): DataRef to be queried.
+            timeout (float, optional): Maximum time in seconds to wait for the value. `None` waits indefinitely. Defaults to 5.
 
         Returns:
             float: Value of the DataRef `dref`.
         
+        Raises:
+            TimeoutError: If no value was received within `timeout` seconds.
+        
         Example:
             xpc = XPlaneConnectX()
             value = xpc.getDREF(""sim/cockpit2/controls/brake_fan_on")
         """
         
-        temp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        idx = len(list(self.reverse_index.keys()))+10   # set the index to the highest index of the permanently observed DataRefs + 10
-        msg = struct.pack("<4sxii400s", b'RREF', 10, idx, dref.encode('utf-8'))   
-        temp_socket.sendto(msg, (self.ip, self.port))
-
-        data, addr = temp_socket.recvfrom(16348)
-        idx_received, value= struct.unpack("<if", data[5:])
-        if idx_received != idx:
-            raise ValueError("Invalid index received.")
+        # the response is received by the observer thread and handed over through a queue registered under a fresh index
+        idx = next(self._getdref_indices)
+        response = queue.SimpleQueue()
+        self._getdref_responses[idx] = response
+        self._observe_async()
+        
+        dref_bytes = self._encode_dref(dref)
+        try:
+            msg = _RREF_PACK.pack(b'RREF', 10, idx, dref_bytes)
+            self.sock.sendto(msg, self._addr)
+            value = response.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No value for {dref} received within {timeout} seconds. Make sure X-Plane is running and accepts incoming connections.") from None
+        finally:
+            del self._getdref_responses[idx]
             
-        # unsubscribe from the DataRef
-        msg = struct.pack("<4sxii400s", b"RREF", 0, idx, dref.encode('utf-8'))   
-        temp_socket.sendto(msg, (self.ip, self.port))
+            # unsubscribe from the DataRef
+            msg = _RREF_PACK.pack(b'RREF', 0, idx, dref_bytes)
+            self.sock.sendto(msg, self._addr)
         
         return value
     
@@ -122,8 +265,8 @@ class XPlaneConnectX():
             xpc.sendDREF("sim/cockpit/electrical/landing_lights_on", 1) # Turn on the landing lights
         """
         
-        msg = struct.pack('<4sxf500s', b'DREF', value, dref.encode('UTF-8'))
-        self.sock.sendto(msg, (self.ip, self.port))
+        msg = _DREF_PACK.pack(b'DREF', value, self._encode_dref(dref))
+        self.sock.sendto(msg, self._addr)
     
     def sendCMND(self, command:str) -> None:
         """Sends simulator commands to the simulator. These are not commands for the airplanes, but commands to operate the simulator (e.g., close X-Plane or take a screenshot)
@@ -136,8 +279,8 @@ class XPlaneConnectX():
             xpc.sendCMND("sim/operation/quit")  # Example command to close X-Plane 
         """
         
-        msg = struct.pack('<4sx500s', b'CMND', command.encode('utf-8'))
-        self.sock.sendto(msg, (self.ip, self.port))
+        msg = _CMND_PACK.pack(b'CMND', command.encode('utf-8'))
+        self.sock.sendto(msg, self._addr)
     
     def sendPOSI(self, lat:float, lon:float, elev:float, phi:float, theta:float, psi_true:float, ac:int=0) -> None:
         """Sets the global position of airplanes as well as their attitude. Note that this is the only option to set 
@@ -157,16 +300,16 @@ class XPlaneConnectX():
             xpc.sendPOSI(37.7749, -122.4194, 100.0, 0.0, 0.0, 90.0)
         """
         
-        msg = struct.pack('<4sxidddfff', b'VEHS',
-                          ac,
-                          lat,
-                          lon,
-                          elev,
-                          psi_true,
-                          theta,
-                          phi)
-        self.sock.sendto(msg, (self.ip, self.port))
-        self.sock.sendto(msg, (self.ip, self.port)) # send twice since the elevation is erroneously calculated based on initial location
+        msg = _POSI_PACK.pack(b'VEHS',
+                              ac,
+                              lat,
+                              lon,
+                              elev,
+                              psi_true,
+                              theta,
+                              phi)
+        self.sock.sendto(msg, self._addr)
+        self.sock.sendto(msg, self._addr) # send twice since the elevation is erroneously calculated based on initial location
     
     def getPOSI(self) -> Tuple[float,float,float,float,float,float,float,float,float,float,float,float,float]:
         """Gets the global position of the ego aircraft. If frequently needed, consider using the permanently observed DataRefs that can be setup when initializing the XPlaneConnectX object.
@@ -198,37 +341,42 @@ class XPlaneConnectX():
             lat, lon, ele, y_agl, phi, theta, psi_true, vx, vy, vz, p, q, r = xpc.getPOSI()
         """
         
-        temp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        msg = struct.pack('4sx10s', b'RPOS', b'100')    # request at 100Hz, this should be sufficiently low enough latency for most use cases
-        temp_socket.sendto(msg, (self.ip, self.port))
-        received = False
-        while not received:
-            data, addr = temp_socket.recvfrom(16348)
-            if data[0:4] == b'RPOS':
-                (lon,         # longitude in degrees
-                lat,          # latitude in degrees
-                ele,          # elevation above mean sea level in meters
-                y_agl,        # elevation above the terrain in meters
-                theta,        # pitch angle in degrees
-                psi_true,     # true hheading in degrees
-                phi,          # roll angle in degrees
-                vx,           # speed in east direction in meters per second (OpenGL coordinate system x-axis, intertial)
-                vy,           # speed in up direction in meters per second (OpenGL coordinate system y-axis, intertial)
-                vz,           # speed in south direction in meters per second (OpenGL coordinate system z-axis, intertial)
-                p,            # roll rate in radians per second
-                q,            # pitch rate in radians per second
-                r,            # yaw rate in radians per second
-                ) = struct.unpack("<xdddffffffffff", data[4:])
-                
-                # unsubscribe from RPOS
-                msg = struct.pack('4sx10s', b'RPOS', b'0')    # setting the frequency to 0
-                self.sock.sendto(msg, (self.ip, self.port))
-                
-                return lat, lon, ele, y_agl, phi, theta, psi_true, vx, vy, vz, p, q, r
-            
-            else:
+        temp_socket = self._create_socket()
+        msg = _RPOS_PACK.pack(b'RPOS', b'100')    # request at 100Hz, this should be sufficiently low enough latency for most use cases
+        temp_socket.sendto(msg, self._addr)
+        try:
+            data = temp_socket.recv(16348)
+            if data[0:4] != b'RPOS':
                 raise ValueError("Received invalid header.")
+            (lon,         # longitude in degrees
+            lat,          # latitude in degrees
+            ele,          # elevation above mean sea level in meters
+            y_agl,        # elevation above the terrain in meters
+            theta,        # pitch angle in degrees
+            psi_true,     # true hheading in degrees
+            phi,          # roll angle in degrees
+            vx,           # speed in east direction in meters per second (OpenGL coordinate system x-axis, intertial)
+            vy,           # speed in up direction in meters per second (OpenGL coordinate system y-axis, intertial)
+            vz,           # speed in south direction in meters per second (OpenGL coordinate system z-axis, intertial)
+            p,            # roll rate in radians per second
+            q,            # pitch rate in radians per second
+            r,            # yaw rate in radians per second
+            ) = _RPOS_UNPACK.unpack_from(data, 4)
+        finally:
+            # unsubscribe from RPOS on the same socket that subscribed
+            msg = _RPOS_PACK.pack(b'RPOS', b'0')    # setting the frequency to 0
+            temp_socket.sendto(msg, self._addr)
             
+            # discard packets that were already queued before closing the socket
+            temp_socket.setblocking(False)
+            try:
+                while True:
+                    temp_socket.recv(16348)
+            except BlockingIOError:
+                pass
+            temp_socket.close()
+        
+        return lat, lon, ele, y_agl, phi, theta, psi_true, vx, vy, vz, p, q, r
     
     def sendCTRL(self, lat_control:float, lon_control:float, rudder_control:float, throttle:float, gear:int, flaps:float, speedbrakes:float, park_break:float) -> None:
         """Send basic controls to the ego aircraft. There are hundreds of DataRefs that provide more fine-grained control. These can be set through the setDREF method.
@@ -248,47 +396,35 @@ class XPlaneConnectX():
             xpc.sendCTRL(lat_control=-0.2, lon_control=0.0, rudder_control=0.2, throttle=0.8, gear=1, flaps=0.5, speedbrakes=0, park_break=0)
         """
         
-        # lateral control
-        dref = "sim/cockpit2/controls/yoke_roll_ratio"
-        msg = struct.pack('<4sxf500s', b'DREF', lat_control, dref.encode('UTF-8'))
-        self.sock.sendto(msg, (self.ip, self.port))     
-        
-        # longitudinal control
-        dref = "sim/cockpit2/controls/yoke_pitch_ratio"
-        msg = struct.pack('<4sxf500s', b'DREF', lon_control, dref.encode('UTF-8'))
-        self.sock.sendto(msg, (self.ip, self.port))
-        
-        # rudder control
-        dref = "sim/cockpit2/controls/yoke_heading_ratio"
-        msg = struct.pack('<4sxf500s', b'DREF', rudder_control, dref.encode('UTF-8'))
-        self.sock.sendto(msg, (self.ip, self.port))
-        
-        # throttle
-        dref = "sim/cockpit2/engine/actuators/throttle_jet_rev_ratio_all"
-        msg = struct.pack('<4sxf500s', b'DREF', throttle, dref.encode('UTF-8'))
-        self.sock.sendto(msg, (self.ip, self.port))
-        
-        # gear
-        dref = "sim/cockpit/switches/gear_handle_status"
-        msg = struct.pack('<4sxf500s', b'DREF', gear, dref.encode('UTF-8'))
-        self.sock.sendto(msg, (self.ip, self.port))
-        
-        # flaps
-        # dref = "sim/cockpit2/controls/flap_handle_request_ratio" #this only for X-Plane 12.0+
-        dref = "sim/cockpit2/controls/flap_ratio"
-        msg = struct.pack('<4sxf500s', b'DREF', flaps, dref.encode('UTF-8'))
-        self.sock.sendto(msg, (self.ip, self.port))
-        
-        # speedbrakes
-        dref = "sim/cockpit2/controls/speedbrake_ratio"
-        msg = struct.pack('<4sxf500s', b'DREF', speedbrakes, dref.encode('UTF-8'))
-        self.sock.sendto(msg, (self.ip, self.port))
-        
-        # park brake
-        dref = "sim/cockpit2/controls/parking_brake_ratio"
-        msg = struct.pack('<4sxf500s', b'DREF', park_break, dref.encode('UTF-8'))
-        self.sock.sendto(msg, (self.ip, self.port))
+        controls = (lat_control, lon_control, rudder_control, throttle, gear, flaps, speedbrakes, park_break)
+        packets = self._ctrl_packets
+        sendto = self.sock.sendto
+        addr = self._addr
+        with self._ctrl_lock:
+            for packet, value in zip(packets, controls):
+                _DREF_VALUE.pack_into(packet, _DREF_VALUE_OFFSET, value)
+            
+            # send all packets back-to-back once they are packed
+            for packet in packets:
+                sendto(packet, addr)
+
+    
+    @staticmethod
+    def timestamp_to_datetime(timestamp:int) -> datetime.datetime:
+        """Converts the timestamp of a subscribed DataRef into the local wall-clock time it was received.
+
+        Args:
+            timestamp (int): Timestamp from XPlaneConnectX.current_dref_values in nanoseconds of the monotonic clock.
 
+        Returns:
+            datetime.datetime: Local time the value was received. Adjustments of the system clock after importing XPlaneConnectX are not taken into account.
+        
+        Example:
+            xpc = XPlaneConnectX()
+            xpc.subscribeDREFs([("sim/flightmodel/position/y_agl", 10)])
+            received = XPlaneConnectX.timestamp_to_datetime(xpc.current_dref_values["sim/flightmodel/position/y_agl"]["timestamp"])
+        """
+        return datetime.datetime.fromtimestamp((timestamp + _MONOTONIC_TO_EPOCH_NS) / 1e9)
     
     def pauseSIM(self, set_pause:bool) -> None:
         """Pauses the simulator.
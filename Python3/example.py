@@ -7,7 +7,7 @@ from XPlaneConnectX import XPlaneConnectX
 def print_state(state):
     print('-'*98)
     for k in state.keys():
-        print(f"{k:<40} {state[k]['value']:<30} {state[k]['timestamp']}")
+        print(f"{k:<40} {state[k]['value']:<30} {XPlaneConnectX.timestamp_to_datetime(state[k]['timestamp'])}")
 
 subscribed_drefs=[("sim/flightmodel/position/groundspeed",10),   # ground speed in m/s at 10Hz
                   ("sim/flightmodel/position/mag_psi",10),       # magnetic heading in degrees at 10Hz